@@ -16,31 +16,257 @@ KEY DIFFERENCE vs Claude's built-in search:
 
 This means our tool_results must be carefully formatted and sent
 back as a "user" message — that's the standard tool-use pattern.
+
+PROMPT CACHING:
+  The system prompt and tool schemas are identical on every step, so they
+  are marked with cache_control. Anthropic caches the prefix
+  (tools → system) after the first call and bills re-reads at ~10%.
+  The newest message also gets a breakpoint (see ConversationMemory),
+  so each step re-reads the previous steps' history from cache too.
 """
 
+import io
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+
 import anthropic
 from agent.prompts      import RESEARCHER_PROMPT, FOLLOWUP_PROMPT, FALLBACK_MESSAGE
 from agent.tool_registry import ToolRegistry
 from memory.conversation import ConversationMemory
+from memory.compression  import compress_old_tool_results
+
+MODEL            = "claude-opus-4-5-20251101"
+MAX_ITERATIONS   = 10   # Safety cap — prevents runaway loops
+MAX_TOOL_WORKERS = 8    # Max tool calls run in parallel within one step
+TOKEN_BUDGET     = 150_000   # Max tokens (incl. cached input) spent on one question
+
+CACHE_CONTROL       = MappingProxyType({"type": "ephemeral"})   # Anthropic prompt-cache breakpoint
+PROMPT_CACHING_BETA = "prompt-caching-2024-07-31"
 
-MODEL          = "claude-opus-4-5-20251101"
-MAX_ITERATIONS = 10   # Safety cap — prevents runaway loops
+
+# One Anthropic client per process, created on first use. Each client owns
+# an httpx connection pool — sharing it means new sessions skip the cold
+# TLS handshake. anthropic.Anthropic is safe to share across threads.
+_CLIENT: anthropic.Anthropic | None = None
+_CLIENT_LOCK = threading.Lock()
+
+
+def _get_client() -> anthropic.Anthropic:
+    """Return the shared client (reads ANTHROPIC_API_KEY from env)."""
+    global _CLIENT
+    with _CLIENT_LOCK:
+        if _CLIENT is None:
+            _CLIENT = anthropic.Anthropic(
+                default_headers={"anthropic-beta": PROMPT_CACHING_BETA},
+            )
+        return _CLIENT
 
 
-class AgentLoop:
+def _system_blocks(prompt: str) -> tuple[MappingProxyType, ...]:
+    """Wrap a system prompt as a single cacheable, read-only text block."""
+    return (MappingProxyType({"type": "text", "text": prompt, "cache_control": CACHE_CONTROL}),)
+
+
+# Built once per process and shared by every AgentLoop, so every API call
+# sends a bit-identical cached prefix. Frozen all the way down — a tuple
+# of read-only mappings — so nobody can change them by accident (the SDK
+# serialises any sequence of blocks and any mapping).
+SYSTEM_RESEARCHER = _system_blocks(RESEARCHER_PROMPT)
+SYSTEM_FOLLOWUP   = _system_blocks(FOLLOWUP_PROMPT)
+
+
+class BaseAgentLoop:
     """
-    Orchestrates the full ReAct loop for one conversation session.
+    State and helpers shared by the sync AgentLoop and the AsyncAgentLoop:
+    memory, tools, prompt/request building and the token budget.
 
-    Usage:
-        agent  = AgentLoop()
-        answer = agent.run("What is the latest news on fusion energy?")
+    Subclasses supply the Anthropic client and the run() entry point.
     """
 
-    def __init__(self):
-        self.client   = anthropic.Anthropic()   # Reads ANTHROPIC_API_KEY from env
+    def __init__(self, client, token_budget: int = TOKEN_BUDGET):
+        """
+        Args:
+            client:       anthropic.Anthropic or anthropic.AsyncAnthropic.
+            token_budget: Max tokens (input incl. cache reads/writes +
+                          output, summed over every step) one question may
+                          use. MAX_ITERATIONS bounds steps, this bounds
+                          cost — one big scrape can blow up input.
+        """
+        self.token_budget = token_budget
+        self._question_tokens = 0   # Tokens used so far by the current question
+
+        self.client   = client
         self.registry = ToolRegistry()
         self.memory   = ConversationMemory()
 
+    # ── One ReAct step (shared by the sync and async loops) ──────────────────
+    # Only the awaited parts — messages.create() and running the tools —
+    # differ between AgentLoop._loop() and AsyncAgentLoop.run().
+
+    def _start_question(self, question: str) -> tuple[dict, ...]:
+        """Record the question and return the system prompt for all its steps."""
+        self.memory.add_user_message(question)
+
+        # Chosen once per question: the same object goes out on every step
+        system = self._select_system()
+
+        print(f"\n🤖 Agent thinking... (max {MAX_ITERATIONS} steps)")
+        return system
+
+    def _start_step(self, step: int) -> str | None:
+        """
+        Budget check and progress line before each API call.
+
+        Returns:
+            The final answer if the loop must stop now, else None.
+        """
+        if step == 1:
+            self._question_tokens = 0
+
+        if self._over_budget():
+            return self._budget_message()
+
+        print(f"  ↻ Step {step}")
+        return None
+
+    def _handle_response(self, response, step: int) -> tuple[str | None, list]:
+        """
+        Records one response in memory and decides what happens next.
+
+        Returns:
+            (answer, [])   → Claude is done (or the budget ran out), return answer
+            (None, blocks) → run these tool_use blocks and loop
+            (None, [])     → unexpected stop_reason, give up
+        """
+        self._track_usage(response)
+
+        # ── Done? → Extract and return answer ────────────────────────────────
+        if response.stop_reason == "end_turn":
+            answer = self._extract_text(response)
+            self.memory.add_assistant_message(response.content)
+            print(f"  ✓ Finished in {step} step(s) — {self.registry.summary()}, {self._question_tokens:,} tokens")
+            return answer or FALLBACK_MESSAGE, []
+
+        # ── Tool call? → Save Claude's response (contains the tool_use blocks)
+        if response.stop_reason == "tool_use":
+            # Over budget → stop before spending search quota on results
+            # that would never be sent. The tool_use turn is not saved, as
+            # it would have no matching tool_result.
+            if self._over_budget():
+                return self._budget_message(), []
+
+            self.memory.add_assistant_message(response.content)
+            return None, [block for block in response.content if block.type == "tool_use"]
+
+        print(f"  ⚠ Unexpected stop_reason: {response.stop_reason}")
+        return None, []
+
+    # ── Helpers ───────────────────────────────────────────────────────────────
+
+    def _select_system(self) -> tuple[dict, ...]:
+        """
+        Pick the (pre-built, cacheable) system prompt for this question.
+
+        If older turns were summarised out of memory, the summary goes in a
+        second block *after* the cached prompt, so the cached prefix is
+        unaffected when the summary grows.
+        """
+        blocks = (
+            SYSTEM_FOLLOWUP
+            if self.memory.is_followup()
+            else SYSTEM_RESEARCHER
+        )
+
+        summary = self.memory.get_summary()
+        if summary:
+            blocks = blocks + ({"type": "text", "text": f"Earlier in this conversation:\n{summary}"},)
+
+        return blocks
+
+    def _request_params(self, system: tuple[dict, ...]) -> dict:
+        """Keyword arguments for one messages.create() call."""
+        # Earlier questions' tool outputs are summarised — Claude has used them
+        messages = compress_old_tool_results(
+            self.memory.get_messages_for_api(),
+            before=self.memory.current_turn_start(),
+        )
+
+        return {
+            "model":      MODEL,
+            "max_tokens": 1024,
+            "system":     system,
+            "tools":      self.registry.get_schemas(),
+            "messages":   messages,
+        }
+
+    def _track_usage(self, response):
+        """
+        Add one response's token usage to the current question's total.
+
+        With prompt caching, input_tokens only counts the uncached tail of
+        the prompt — cache writes and cache reads are reported separately
+        and are still processed (and billed) on every step.
+        """
+        usage = response.usage
+        self._question_tokens += (
+            usage.input_tokens
+            + usage.output_tokens
+            + (getattr(usage, "cache_creation_input_tokens", 0) or 0)
+            + (getattr(usage, "cache_read_input_tokens", 0) or 0)
+        )
+
+    def _over_budget(self) -> bool:
+        return self._question_tokens > self.token_budget
+
+    def _budget_message(self) -> str:
+        print(f"  ⚠ Token budget hit ({self._question_tokens:,} > {self.token_budget:,})")
+        return f"{FALLBACK_MESSAGE}\n  (token budget of {self.token_budget:,} hit)"
+
+    @staticmethod
+    def _package_results(blocks: list, outputs: list[str]) -> list[dict]:
+        """Pair tool outputs with their tool_use blocks in the API format."""
+        return [
+            {
+                "type":        "tool_result",
+                "tool_use_id": block.id,     # Must match Claude's tool_use id
+                "content":     output,        # String result from our tool
+            }
+            for block, output in zip(blocks, outputs)
+        ]
+
+    def _extract_text(self, response) -> str:
+        """Pull plain text from response content blocks (single pass)."""
+        buf = io.StringIO()
+        for block in response.content:
+            text = getattr(block, "text", None)
+            if text:
+                buf.write(text)
+                buf.write("\n")
+        return buf.getvalue().strip()
+
+    def new_session(self):
+        """Wipe memory and reset tool counters for a fresh conversation."""
+        self.memory.clear()
+        self.registry.reset()
+        print("  🔄 New session started.")
+
+
+class AgentLoop(BaseAgentLoop):
+    """
+    Orchestrates the full ReAct loop for one conversation session.
+
+    Usage:
+        agent   = AgentLoop()
+        answer  = agent.run("What is the latest news on fusion energy?")
+        answers = agent.run_batch(["Question 1", "Question 2"])   # offline / bulk
+    """
+
+    def __init__(self, token_budget: int = TOKEN_BUDGET):
+        # Shared by every AgentLoop in the process
+        super().__init__(_get_client(), token_budget)
+
     # ── Main entry point ──────────────────────────────────────────────────────
 
     def run(self, question: str) -> str:
@@ -53,91 +279,158 @@ class AgentLoop:
         Returns:
             Claude's final answer as a plain string.
         """
-        self.memory.add_user_message(question)
+        system = self._start_question(question)
 
-        system = FOLLOWUP_PROMPT if self.memory.is_followup() else RESEARCHER_PROMPT
+        return self._loop(system)
 
-        print(f"\n🤖 Agent thinking... (max {MAX_ITERATIONS} steps)")
-
-        for step in range(1, MAX_ITERATIONS + 1):
-            print(f"  ↻ Step {step}")
+    def run_batch(
+        self,
+        questions:     list[str],
+        poll_interval: float = 20,
+        use_batch_api: bool  = True,
+    ) -> list[str]:
+        """
+        Answers independent questions (evals, digests) in bulk.
 
-            # ── REASON: Ask Claude what to do next ───────────────────────────
-            response = self.client.messages.create(
-                model     = MODEL,
-                max_tokens= 1024,
-                system    = system,
-                tools     = self.registry.get_schemas(),
-                messages  = self.memory.get_messages(),
-            )
+        The first ReAct step of every question goes out as one Message
+        Batches API job (50% cheaper, but asynchronous — can take minutes).
+        Questions that need tools then finish with normal sync calls.
 
-            # ── Done? → Extract and return answer ────────────────────────────
-            if response.stop_reason == "end_turn":
-                answer = self._extract_text(response)
-                self.memory.add_assistant_message(response.content)
-                print(f"  ✓ Finished in {step} step(s) — {self.registry.summary()}")
-                return answer or FALLBACK_MESSAGE
+        Each question gets its own fresh memory and its own tool counters;
+        the interactive session (self.memory, self.registry) is left
+        untouched.
 
-            # ── Tool call? → Execute it and loop ─────────────────────────────
-            elif response.stop_reason == "tool_use":
-                # Save Claude's response (contains the tool_use block)
-                self.memory.add_assistant_message(response.content)
+        Args:
+            questions:     Questions to answer (no shared context).
+            poll_interval: Seconds between batch status checks.
+            use_batch_api: False → answer every question with sync calls.
 
-                # ACT + OBSERVE: run each tool, collect results
-                tool_results = self._execute_tools(response)
+        Returns:
+            Answers in the same order as `questions`.
+        """
+        session_memory   = self.memory
+        session_registry = self.registry
+        memories         = []
+
+        for question in questions:
+            memory = ConversationMemory()
+            memory.add_user_message(question)
+            memories.append(memory)
+
+        try:
+            first_steps = [None] * len(questions)
+            if use_batch_api and questions:
+                first_steps = self._run_first_steps_as_batch(memories, poll_interval)
+
+            answers       = []
+            self.registry = ToolRegistry()
+            for i, (memory, first_step) in enumerate(zip(memories, first_steps), 1):
+                self.memory = memory
+                self.registry.reset()   # "Finished" line shows this question's tools only
+                print(f"\n🤖 Batch question {i}/{len(questions)}")
+                answers.append(self._loop(SYSTEM_RESEARCHER, pending=first_step))
+            return answers
+
+        finally:
+            self.memory   = session_memory
+            self.registry = session_registry
+
+    # ── ReAct loop ────────────────────────────────────────────────────────────
+
+    def _loop(self, system: tuple[dict, ...], pending=None) -> str:
+        """
+        Runs REASON → ACT → OBSERVE steps on self.memory until Claude answers.
 
-                # Send results back to Claude as a user message
-                self.memory.add_tool_results(tool_results)
+        Args:
+            system:  System prompt blocks for every call.
+            pending: Optional response for step 1 that was already fetched
+                     (run_batch); otherwise step 1 calls the API as usual.
+        """
+        for step in range(1, MAX_ITERATIONS + 1):
+            stop = self._start_step(step)
+            if stop is not None:
+                return stop
 
+            # ── REASON: Ask Claude what to do next ───────────────────────────
+            if pending is not None:
+                response, pending = pending, None
             else:
-                print(f"  ⚠ Unexpected stop_reason: {response.stop_reason}")
+                response = self.client.messages.create(**self._request_params(system))
+
+            answer, blocks = self._handle_response(response, step)
+            if answer is not None:
+                return answer
+            if not blocks:
                 break
 
-        return FALLBACK_MESSAGE
+            # ── ACT + OBSERVE: run each tool, send results back to Claude ────
+            self.memory.add_tool_results(self._execute_tools(blocks))
 
-    # ── Tool execution ────────────────────────────────────────────────────────
+        return FALLBACK_MESSAGE
 
-    def _execute_tools(self, response) -> list[dict]:
+    def _run_first_steps_as_batch(self, memories: list, poll_interval: float) -> list:
         """
-        Finds all tool_use blocks in Claude's response,
-        runs each tool, and packages the results.
+        Submits step 1 for each memory as one Message Batch and waits for it.
 
         Returns:
-            List of tool_result dicts ready to send back to Claude.
-
-        INTERNAL: The tool_result format is required by the Anthropic API.
-        Each result must reference the tool_use_id from Claude's request.
+            One response Message per memory, or None where the batch entry
+            failed (that question's step 1 then runs synchronously).
         """
-        results = []
+        session_memory = self.memory
+        batch_requests = []
+
+        for i, memory in enumerate(memories):
+            self.memory = memory
+            batch_requests.append({
+                "custom_id": f"q{i}",
+                "params":    self._request_params(SYSTEM_RESEARCHER),
+            })
+        self.memory = session_memory
 
-        for block in response.content:
-            if block.type != "tool_use":
-                continue
+        batch = self.client.messages.batches.create(requests=batch_requests)
+        print(f"\n📦 Submitted batch {batch.id} ({len(batch_requests)} question(s))")
 
-            # Run the tool via registry
-            output = self.registry.execute(block.name, block.input)
+        while batch.processing_status != "ended":
+            time.sleep(poll_interval)
+            batch = self.client.messages.batches.retrieve(batch.id)
+            print(f"  ⏳ Batch {batch.processing_status}: {batch.request_counts}")
 
-            # Package result in the format the API expects
-            results.append({
-                "type":        "tool_result",
-                "tool_use_id": block.id,     # Must match Claude's tool_use id
-                "content":     output,        # String result from our tool
-            })
+        responses = [None] * len(memories)
+        for entry in self.client.messages.batches.results(batch.id):
+            if entry.result.type == "succeeded":
+                responses[int(entry.custom_id[1:])] = entry.result.message
+            else:
+                print(f"  ⚠ Batch entry {entry.custom_id} {entry.result.type} — retrying sync")
 
-        return results
+        return responses
 
-    # ── Helpers ───────────────────────────────────────────────────────────────
+    # ── Tool execution ────────────────────────────────────────────────────────
 
-    def _extract_text(self, response) -> str:
-        """Pull plain text from response content blocks."""
-        return "\n".join(
-            block.text
-            for block in response.content
-            if hasattr(block, "text") and block.text
-        ).strip()
+    def _execute_tools(self, blocks: list) -> list[dict]:
+        """
+        Runs each tool_use block from Claude's response and packages
+        the results.
 
-    def new_session(self):
-        """Wipe memory and reset tool counters for a fresh conversation."""
-        self.memory.clear()
-        self.registry.reset()
-        print("  🔄 New session started.")
+        When Claude asks for several tools at once they run concurrently —
+        they're I/O-bound, so the step takes max(latency) not sum(latency).
+        Results keep the order of the tool_use blocks.
+
+        Returns:
+            List of tool_result dicts ready to send back to Claude.
+
+        INTERNAL: The tool_result format is required by the Anthropic API.
+        Each result must reference the tool_use_id from Claude's request.
+        """
+        # Run the tools via registry (skip the pool for a single call)
+        if len(blocks) <= 1:
+            outputs = [self.registry.execute(block.name, block.input) for block in blocks]
+        else:
+            with ThreadPoolExecutor(max_workers=min(MAX_TOOL_WORKERS, len(blocks))) as pool:
+                futures = [
+                    pool.submit(self.registry.execute, block.name, block.input)
+                    for block in blocks
+                ]
+                outputs = [future.result() for future in futures]
+
+        # Package results in the format the API expects
+        return self._package_results(blocks, outputs)
@@ -0,0 +1,96 @@
+"""
+agent/agent_loop_async.py
+=========================
+Async version of the ReAct loop (see agent/agent_loop.py for the pattern).
+
+WHY an async loop?
+  The sync AgentLoop blocks a whole thread while Claude generates and while
+  tools fetch pages. In a server handling many sessions, the async loop lets
+  them all share one event loop: each in-flight request costs a coroutine,
+  not a thread.
+
+  Per-question latency is the same; throughput scales with concurrency.
+
+Usage:
+    agent  = AsyncAgentLoop()
+    answer = await agent.run("What is the latest news on fusion energy?")
+    await agent.aclose()
+
+The sync AgentLoop stays as-is for the CLI — wrapping this class in
+asyncio.run() per question would tie the HTTP clients to a new event loop
+every call.
+"""
+
+import asyncio
+
+import anthropic
+from agent.agent_loop import BaseAgentLoop, MAX_ITERATIONS, PROMPT_CACHING_BETA, TOKEN_BUDGET
+from agent.prompts    import FALLBACK_MESSAGE
+
+
+class AsyncAgentLoop(BaseAgentLoop):
+    """
+    Same behaviour as AgentLoop, but run() is a coroutine and tools use
+    non-blocking HTTP. Prompt building, memory and caching are shared via
+    BaseAgentLoop. Batch jobs (run_batch) stay on the sync AgentLoop.
+    """
+
+    def __init__(self, token_budget: int = TOKEN_BUDGET):
+        # Per instance, not shared like the sync client: an async client's
+        # connections belong to the event loop that opened them.
+        client = anthropic.AsyncAnthropic(   # Reads ANTHROPIC_API_KEY from env
+            default_headers={"anthropic-beta": PROMPT_CACHING_BETA},
+        )
+        super().__init__(client, token_budget)
+
+    # ── Main entry point ──────────────────────────────────────────────────────
+
+    async def run(self, question: str) -> str:
+        """
+        Runs the ReAct loop for a single question.
+
+        Args:
+            question: The user's question (plain string).
+
+        Returns:
+            Claude's final answer as a plain string.
+        """
+        system = self._start_question(question)
+
+        for step in range(1, MAX_ITERATIONS + 1):
+            stop = self._start_step(step)
+            if stop is not None:
+                return stop
+
+            # ── REASON: Ask Claude what to do next ───────────────────────────
+            response = await self.client.messages.create(**self._request_params(system))
+
+            answer, blocks = self._handle_response(response, step)
+            if answer is not None:
+                return answer
+            if not blocks:
+                break
+
+            # ── ACT + OBSERVE: run each tool, send results back to Claude ────
+            self.memory.add_tool_results(await self._execute_tools(blocks))
+
+        return FALLBACK_MESSAGE
+
+    # ── Tool execution ────────────────────────────────────────────────────────
+
+    async def _execute_tools(self, blocks: list) -> list[dict]:
+        """
+        Runs every tool_use block concurrently with asyncio.gather.
+        Results keep the order of the tool_use blocks.
+        """
+        outputs = await asyncio.gather(
+            *(self.registry.aexecute(block.name, block.input) for block in blocks)
+        )
+        return self._package_results(blocks, outputs)
+
+    # ── Cleanup ───────────────────────────────────────────────────────────────
+
+    async def aclose(self):
+        """Close the Anthropic client and the tools' HTTP clients."""
+        await self.client.close()
+        await self.registry.aclose()
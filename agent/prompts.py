@@ -7,6 +7,10 @@ Keeping prompts here means:
   - Tune behaviour without touching logic files
   - Easy to A/B test different instructions
   - Clear record of what the agent "knows" about itself
+
+Keep these strings STATIC — no dates, counters or per-session values.
+They're the cached prompt prefix; any change in the text (even a
+timestamp) means a cache miss on every API call.
 """
 
 # ── First question ────────────────────────────────────────────────────────────
@@ -11,11 +11,129 @@ So here the registry must:
   1. Tell Claude what tools exist (via schemas)
   2. Actually EXECUTE the search when Claude calls it
   3. Return the result so the agent_loop can send it back to Claude
+
+TOOLS (the schemas sent to Claude are deliberately terse):
+  web_search(query, num_results=5)
+    Searches Google via Serper for up-to-date facts. Returns the direct
+    answer box (if any) plus title, summary and URL of the top results.
+    num_results defaults to 5, max 10. Specific queries work best.
+
+  web_scraper(url)
+    Fetches a page and returns its cleaned full text. Use it when search
+    snippets aren't detailed enough. URL must start with http(s)://.
+
+MEMOIZATION:
+  ReAct sessions often repeat the exact same tool call (same query, same
+  URL) — across steps, follow-ups, even runs. execute() remembers
+  (tool name, canonical input) → output and short-circuits repeats.
+  This is the only tool cache — the tools themselves always fetch.
+
+  One memo is shared by every ToolRegistry in the process. It holds at
+  most MEMO_SIZE entries, which expire after MEMO_TTL_SECS (short —
+  search results go stale). It is saved as JSON to MEMO_PATH at most
+  every MEMO_SAVE_SECS (and at exit), so it survives restarts without
+  rewriting the file on every call. execute() writes inline on its tool
+  thread; aexecute() writes in a worker thread, off the event loop.
+  Error outputs are never memoized.
 """
 
+import asyncio
+import atexit
+import os
+import threading
+import time
+from pathlib import Path
+
+import orjson
+
+from tools.cache       import TTLCache
 from tools.web_search  import WebSearch
 from tools.web_scraper import WebScraper
 
+MEMO_PATH      = Path.home() / ".cache" / "research-agent" / "tool_memo.json"
+MEMO_TTL_SECS  = 10 * 60   # Memoized outputs expire after 10 minutes
+MEMO_SIZE      = 256       # Max tool calls remembered (LRU beyond that)
+MEMO_SAVE_SECS = 30        # Write the memo to disk at most this often
+
+
+class _ToolMemo:
+    """
+    Process-wide (tool name, canonical JSON input) → output memo.
+
+    A TTLCache in memory; saved to MEMO_PATH as JSON rows of
+    [tool name, input JSON, stored_at, output].
+    """
+
+    def __init__(self):
+        self._cache    = TTLCache(maxsize=MEMO_SIZE, ttl=MEMO_TTL_SECS)
+        self._lock     = threading.Lock()   # Guards the fields below (never held during file I/O)
+        self._loaded   = False
+        self._dirty    = False
+        self._saved_at = time.monotonic()
+
+    def get(self, key: tuple[str, str]) -> str | None:
+        return self._cache.get(key)
+
+    def put(self, key: tuple[str, str], output: str):
+        self._cache.set(key, output)
+        with self._lock:
+            self._dirty = True
+
+    def save_due(self) -> bool:
+        """True if there are unsaved entries and the last save is MEMO_SAVE_SECS old."""
+        with self._lock:
+            return self._dirty and time.monotonic() - self._saved_at >= MEMO_SAVE_SECS
+
+    def load(self):
+        """Read the saved memo once per process (expired rows are skipped)."""
+        with self._lock:
+            if self._loaded:
+                return
+            self._loaded = True
+
+        now = time.time()
+        try:
+            rows = orjson.loads(MEMO_PATH.read_bytes())
+            for tool_name, input_json, stored_at, output in rows[-MEMO_SIZE:]:
+                if now - stored_at < MEMO_TTL_SECS:
+                    self._cache.set((tool_name, input_json), output, stored_at=stored_at)
+        except (OSError, ValueError, TypeError):
+            pass   # Missing or unreadable file — start empty
+
+    def save(self):
+        """
+        Write live entries atomically; failures only cost the persistence.
+
+        Only the flag update happens under the lock — the rows are
+        snapshotted and written outside it, so put() calls from other
+        tool threads never wait on disk I/O.
+        """
+        with self._lock:
+            if not self._dirty:
+                return
+            self._dirty    = False
+            self._saved_at = time.monotonic()
+
+        rows = [[*key, stored_at, output] for key, stored_at, output in self._cache.items()]
+        try:
+            MEMO_PATH.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = MEMO_PATH.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            tmp_path.write_bytes(orjson.dumps(rows))
+            os.replace(tmp_path, MEMO_PATH)
+        except OSError:
+            pass
+
+    def clear(self):
+        """Forget every entry, in memory and on disk."""
+        self._cache.clear()
+        with self._lock:
+            self._dirty = False
+        MEMO_PATH.unlink(missing_ok=True)
+
+
+_MEMO = _ToolMemo()
+atexit.register(_MEMO.save)   # Flush whatever the throttle held back
+
 
 class ToolRegistry:
     """
@@ -30,8 +148,12 @@ class ToolRegistry:
     def __init__(self):
         self.searcher = WebSearch()
         self.scraper  = WebScraper()
+        self._schemas = self._build_schemas()
         self._search_count = 0
         self._scrape_count = 0
+        self._lock = threading.Lock()   # execute() may run on several threads
+
+        _MEMO.load()
 
     # ── Tool schemas (tell Claude what tools exist) ───────────────────────────
 
@@ -39,53 +161,54 @@ class ToolRegistry:
         """
         Returns tool definitions for the Anthropic API.
 
+        Built once in __init__ and returned by reference — the same list
+        goes out on every call, so don't mutate it.
+        """
+        return self._schemas
+
+    @staticmethod
+    def _build_schemas() -> list[dict]:
+        """
+        Builds the tool definitions (see the module docstring for the
+        long-form description of each tool).
+
         IMPORTANT: Because we use Serper (not Claude's built-in search),
         web_search is defined as a CUSTOM tool with a proper JSON schema.
         Claude will call it like a function, and WE run it.
+
+        Descriptions are kept terse: schemas are re-sent on every ReAct
+        step, so every word here is paid for on every API call.
+
+        The last schema carries a cache_control breakpoint, which caches
+        every tool definition before it as part of the prompt prefix.
         """
-        return [
+        schemas = [
             {
                 "name": "web_search",
-                "description": (
-                    "Search Google for current information. "
-                    "Use this for any question that needs up-to-date facts. "
-                    "Returns titles, summaries, and URLs of top results."
-                ),
+                "description": "Google search for current facts. Returns title/snippet/url.",
                 "input_schema": {
                     "type": "object",
                     "properties": {
-                        "query": {
-                            "type": "string",
-                            "description": "The search query. Be specific for better results.",
-                        },
-                        "num_results": {
-                            "type": "integer",
-                            "description": "Number of results to return (default 5, max 10).",
-                            "default": 5,
-                        },
+                        "query":       {"type": "string"},
+                        "num_results": {"type": "integer", "maximum": 10},
                     },
                     "required": ["query"],
                 },
             },
             {
                 "name": "web_scraper",
-                "description": (
-                    "Fetch and read the full text of a specific URL. "
-                    "Use this when search snippets aren't detailed enough "
-                    "and you need the complete article content."
-                ),
+                "description": "Fetch full text of a URL. Use when snippets are too short.",
                 "input_schema": {
                     "type": "object",
                     "properties": {
-                        "url": {
-                            "type": "string",
-                            "description": "Full URL to fetch (must start with https://).",
-                        }
+                        "url": {"type": "string"},
                     },
                     "required": ["url"],
                 },
             },
         ]
+        schemas[-1]["cache_control"] = {"type": "ephemeral"}
+        return schemas
 
     # ── Execute a tool call ───────────────────────────────────────────────────
 
@@ -100,30 +223,115 @@ class ToolRegistry:
         Returns:
             String result — this goes straight back to Claude as context.
         """
+        key    = self._memo_key(tool_name, tool_input)
+        output = self._memo_get(key)
+        if output is None:
+            output = self._dispatch(tool_name, tool_input)
+            self._memo_put(key, output)
+            if _MEMO.save_due():
+                _MEMO.save()   # Inline on this tool thread, at most every MEMO_SAVE_SECS
+        return output
+
+    async def aexecute(self, tool_name: str, tool_input: dict) -> str:
+        """Async version of execute() — same memo, non-blocking I/O."""
+        key    = self._memo_key(tool_name, tool_input)
+        output = self._memo_get(key)
+        if output is None:
+            output = await self._adispatch(tool_name, tool_input)
+            self._memo_put(key, output)
+            if _MEMO.save_due():
+                await asyncio.to_thread(_MEMO.save)   # Keep file I/O off the event loop
+        return output
+
+    def _dispatch(self, tool_name: str, tool_input: dict) -> str:
+        """Route a call to the right tool (no memo)."""
         if tool_name == "web_search":
             query       = tool_input.get("query", "")
             num_results = tool_input.get("num_results", 5)
-            self._search_count += 1
-            print(f"  🌐 Search #{self._search_count}: '{query}'")
+            with self._lock:
+                self._search_count += 1
+                count = self._search_count
+            print(f"  🌐 Search #{count}: '{query}'")
             return self.searcher.search_and_format(query, num_results)
 
         elif tool_name == "web_scraper":
             url = tool_input.get("url", "")
-            self._scrape_count += 1
+            with self._lock:
+                self._scrape_count += 1
             return self.scraper.scrape(url)
 
         else:
             return f"Error: Unknown tool '{tool_name}'"
 
+    async def _adispatch(self, tool_name: str, tool_input: dict) -> str:
+        """Async version of _dispatch()."""
+        if tool_name == "web_search":
+            query       = tool_input.get("query", "")
+            num_results = tool_input.get("num_results", 5)
+            with self._lock:
+                self._search_count += 1
+                count = self._search_count
+            print(f"  🌐 Search #{count}: '{query}'")
+            return await self.searcher.asearch(query, num_results)
+
+        elif tool_name == "web_scraper":
+            url = tool_input.get("url", "")
+            with self._lock:
+                self._scrape_count += 1
+            return await self.scraper.ascrape(url)
+
+        else:
+            return f"Error: Unknown tool '{tool_name}'"
+
+    async def aclose(self):
+        """Close the tools' async HTTP clients."""
+        await self.searcher.aclose()
+        await self.scraper.aclose()
+
     # ── Session helpers ───────────────────────────────────────────────────────
 
-    def reset(self):
-        """Reset counters for a new session."""
+    def reset(self, clear_memo: bool = False):
+        """
+        Reset counters for a new session.
+
+        The tool memo is kept (it's cross-session by design) unless
+        clear_memo=True, which also deletes the saved copy.
+        """
         self._search_count = 0
         self._scrape_count = 0
 
+        if clear_memo:
+            _MEMO.clear()
+
     def summary(self) -> str:
         parts = [f"{self._search_count} search(es)"]
         if self._scrape_count:
             parts.append(f"{self._scrape_count} scrape(s)")
         return ", ".join(parts)
+
+    # ── Memo helpers ──────────────────────────────────────────────────────────
+
+    @staticmethod
+    def _memo_key(tool_name: str, tool_input: dict) -> tuple[str, str]:
+        """
+        Canonical key — sorted keys so {"a", "b"} order doesn't matter.
+        Search queries are case/whitespace-insensitive and num_results
+        defaults to 5, as in _dispatch().
+        """
+        if tool_name == "web_search":
+            tool_input = {
+                "query":       str(tool_input.get("query", "")).strip().lower(),
+                "num_results": tool_input.get("num_results", 5),
+            }
+        return tool_name, orjson.dumps(tool_input, option=orjson.OPT_SORT_KEYS).decode()
+
+    def _memo_get(self, key: tuple[str, str]) -> str | None:
+        output = _MEMO.get(key)
+        if output is not None:
+            print(f"  ♻️  Reusing earlier {key[0]} result: {key[1]}")
+        return output
+
+    def _memo_put(self, key: tuple[str, str], output: str):
+        if output.startswith("Error"):
+            return   # Often transient — let the next call retry
+        _MEMO.put(key, output)
@@ -0,0 +1,12 @@
+# Lets pytest import the project packages (agent, memory, tools) from the repo root.
+
+import pytest
+
+from agent import tool_registry
+
+
+@pytest.fixture(autouse=True)
+def isolated_tool_memo(tmp_path, monkeypatch):
+    """Every test gets an empty tool memo saved under tmp_path, never ~/.cache."""
+    monkeypatch.setattr(tool_registry, "MEMO_PATH", tmp_path / "tool_memo.json")
+    monkeypatch.setattr(tool_registry, "_MEMO", tool_registry._ToolMemo())
@@ -4,7 +4,8 @@ main.py
 Entry point for the Research Assistant Agent.
 
 Run with:
-    python main.py
+    python main.py                       # interactive
+    python main.py --batch questions.txt # one question per line, 50% cheaper
 """
 
 import os
@@ -59,8 +60,26 @@ def print_answer(answer: str):
     print()
 
 
+def run_batch_file(path: str):
+    """Answer every non-empty line of `path` via the Message Batches API."""
+    with open(path, encoding="utf-8") as f:
+        questions = [line.strip() for line in f if line.strip()]
+
+    agent   = AgentLoop()
+    answers = agent.run_batch(questions)
+
+    for question, answer in zip(questions, answers):
+        print(f"\n❓ {question}")
+        print_answer(answer)
+
+
 def main():
     check_env()
+
+    if len(sys.argv) == 3 and sys.argv[1] == "--batch":
+        run_batch_file(sys.argv[2])
+        return
+
     print(BANNER)
 
     agent = AgentLoop()
@@ -0,0 +1,115 @@
+"""
+memory/compression.py
+=====================
+Shrinks stale tool results before the history is sent to the API.
+
+WHY this is needed:
+  Every API call re-sends the full history, including every web_search
+  and web_scraper output (up to ~3000 chars each). Once Claude has acted
+  on an old result it rarely needs the full text again.
+
+WHAT it does:
+  Tool results from EARLIER questions are replaced with a one-line
+  summary, e.g.:
+
+    [web_search] OK (2841 chars) | query="fusion energy 2025" | 5 results
+
+  Results of the current question are left verbatim: Claude may still be
+  using them (e.g. scraping a URL from a search), and they sit inside the
+  prefix the previous step cached — rewriting them would miss the cache
+  on every step. Older questions are compressed once they fall behind
+  the current one and then stay identical, so they cache fine too.
+
+  It works on copies — ConversationMemory keeps the full text, so the
+  compression is applied fresh (and reversibly) on every call.
+"""
+
+import re
+
+SUMMARY_LINE_CHARS = 80   # Max chars kept from the first line of a result
+
+_RESULT_LINE_RE = re.compile(r"^Result \d+:", re.MULTILINE)   # See WebSearch._format
+
+
+def compress_old_tool_results(messages: list[dict], before: int) -> list[dict]:
+    """
+    Returns a copy of `messages` with earlier questions' tool results summarised.
+
+    Args:
+        messages: History in API format (see memory/conversation.py).
+        before:   Index where the current question starts
+                  (ConversationMemory.current_turn_start()). Only tool
+                  results in messages[:before] are compressed.
+
+    Returns:
+        A new list. Messages that were changed are copied; the rest are
+        shared with the input, which is never modified.
+    """
+    tool_calls = _index_tool_calls(messages)
+    compressed = list(messages)
+
+    for i, message in enumerate(messages[:before]):
+        content = message["content"]
+        if message["role"] != "user" or isinstance(content, str):
+            continue
+
+        new_content = list(content)
+        changed     = False
+
+        for j, block in enumerate(new_content):
+            if not isinstance(block, dict) or block.get("type") != "tool_result":
+                continue
+            if not isinstance(block.get("content"), str):
+                continue
+
+            name, tool_input = tool_calls.get(block["tool_use_id"], ("tool", {}))
+            new_content[j] = {**block, "content": _summarise(name, tool_input, block["content"])}
+            changed        = True
+
+        if changed:
+            compressed[i] = {**message, "content": new_content}
+
+    return compressed
+
+
+# ── Private helpers ───────────────────────────────────────────────────────────
+
+def _index_tool_calls(messages: list[dict]) -> dict[str, tuple[str, dict]]:
+    """Map tool_use_id → (tool name, input) from the assistant messages."""
+    calls = {}
+
+    for message in messages:
+        if message["role"] != "assistant" or isinstance(message["content"], str):
+            continue
+
+        for block in message["content"]:
+            if isinstance(block, dict):
+                if block.get("type") == "tool_use":
+                    calls[block["id"]] = (block["name"], block.get("input", {}))
+            elif getattr(block, "type", None) == "tool_use":
+                calls[block.id] = (block.name, block.input)
+
+    return calls
+
+
+def _summarise(name: str, tool_input: dict, output: str) -> str:
+    """Build the one-line stand-in for a tool result."""
+    status = "ERROR" if output.startswith("Error") else "OK"
+
+    parts = [f"[{name}] {status} ({len(output)} chars)"]
+    parts.extend(f'{key}="{value}"' for key, value in tool_input.items())
+
+    if name == "web_search" and status == "OK":
+        # The first line is just "Result 1:" — the count says more
+        parts.append(f"{len(_RESULT_LINE_RE.findall(output))} results")
+    else:
+        # Skip the "SOURCE: <url>" header of scrapes — the url is in the input
+        first_line = next(
+            (line.strip() for line in output.splitlines()
+             if line.strip() and not line.startswith("SOURCE:")),
+            "",
+        )
+        if first_line:
+            parts.append(first_line[:SUMMARY_LINE_CHARS])
+
+    return " | ".join(parts)
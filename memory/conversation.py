@@ -21,22 +21,62 @@ RULES enforced here:
   - Roles must alternate: user → assistant → user → ...
   - Tool results are sent as a "user" message (API requirement)
   - Assistant messages store full content block list (not just text)
+
+PROMPT CACHING:
+  Within one question the earlier tool_use/tool_result turns never change,
+  so get_messages_for_api() stamps a cache_control breakpoint on the newest
+  message. The next ReAct step then re-reads everything up to it from cache.
+
+SLIDING WINDOW:
+  Only the last `max_turns` questions (with their tool calls and answers)
+  are kept verbatim. Older turns are folded into a short running summary,
+  built by a local template — no extra LLM call:
+
+    Turn 1: Q='What is ...?' → A='The answer is ...'
+
+  AgentLoop adds the summary to the system prompt, so prompt size stays
+  roughly constant however long the session runs.
 """
 
+from types import MappingProxyType
+
+CACHE_CONTROL = MappingProxyType({"type": "ephemeral"})   # Shared by every stamped block — read-only
+
+SUMMARY_QUESTION_CHARS = 80    # Chars of each old question kept in the summary
+SUMMARY_ANSWER_CHARS   = 200   # Chars of each old answer kept in the summary
+
 
 class ConversationMemory:
     """
     Stores and exposes the message history for one session.
     """
 
-    def __init__(self):
-        self._messages:   list[dict] = []
-        self._turn_count: int        = 0
+    def __init__(self, max_turns: int = 6):
+        # The current question is always kept verbatim, so at least 1
+        if max_turns < 1:
+            raise ValueError(f"max_turns must be at least 1, got {max_turns}")
+
+        self.max_turns = max_turns            # Questions kept verbatim (incl. current)
+
+        self._messages:    list[dict] = []
+        self._turn_count:  int        = 0
+        self._turn_starts: list[int]  = []    # Index in _messages where each question starts
+        self._summary:     str        = ""    # Folded-away older turns
+        self._folded:      int        = 0     # How many turns are in the summary
 
     # ── Add messages ──────────────────────────────────────────────────────────
 
     def add_user_message(self, text: str):
-        """Add a plain-text user message."""
+        """
+        Add a plain-text user message (a new question).
+
+        This is the only point where a Q→A turn is known to be complete,
+        so it's where the oldest turns get folded into the summary.
+        """
+        while len(self._turn_starts) >= self.max_turns:
+            self._fold_oldest_turn()
+
+        self._turn_starts.append(len(self._messages))
         self._messages.append({"role": "user", "content": text})
 
     def add_assistant_message(self, content):
@@ -66,19 +106,100 @@ class ConversationMemory:
     # ── Read messages ─────────────────────────────────────────────────────────
 
     def get_messages(self) -> list[dict]:
-        """Returns the full history to pass to the API."""
+        """Returns the windowed history (last `max_turns` questions) for the API."""
         return self._messages
 
+    def get_summary(self) -> str:
+        """Summary of turns that fell out of the window ("" if none)."""
+        return self._summary
+
+    def get_messages_for_api(self) -> list[dict]:
+        """
+        Returns the history with a cache breakpoint on the last message.
+
+        Only the last message is copied — self._messages is never modified,
+        so the breakpoint moves forward cleanly on every call.
+        """
+        if not self._messages:
+            return []
+
+        last    = self._messages[-1]
+        content = last["content"]
+
+        if isinstance(content, str):
+            blocks = [{"type": "text", "text": content}]
+        else:
+            blocks = [_as_dict(block) for block in content]
+
+        if not blocks:
+            return list(self._messages)
+
+        blocks[-1] = {**blocks[-1], "cache_control": CACHE_CONTROL}
+        return self._messages[:-1] + [{**last, "content": blocks}]
+
+    def current_turn_start(self) -> int:
+        """Index in get_messages() where the current question starts (0 if none)."""
+        return self._turn_starts[-1] if self._turn_starts else 0
+
     def is_followup(self) -> bool:
         """True if at least one full Q→A turn has completed."""
-        return self._turn_count > 0
+        return bool(self._summary) or self._turn_count > 0
 
     # ── Session management ────────────────────────────────────────────────────
 
     def clear(self):
         """Wipe all history — start fresh."""
-        self._messages   = []
-        self._turn_count = 0
+        self._messages    = []
+        self._turn_count  = 0
+        self._turn_starts = []
+        self._summary     = ""
+        self._folded      = 0
 
     def __repr__(self) -> str:
-        return f"ConversationMemory(messages={len(self._messages)}, turns={self._turn_count})"
+        return (
+            f"ConversationMemory(messages={len(self._messages)}, turns={self._turn_count}, "
+            f"summarised={self._folded})"
+        )
+
+    # ── Private helpers ───────────────────────────────────────────────────────
+
+    def _fold_oldest_turn(self):
+        """Drop the oldest question's messages, keeping a one-line summary."""
+        end  = self._turn_starts[1] if len(self._turn_starts) > 1 else len(self._messages)
+        turn = self._messages[:end]
+
+        question = turn[0]["content"]
+        answer   = next(
+            (_text_of(m["content"]) for m in reversed(turn) if m["role"] == "assistant"),
+            "",
+        )
+
+        self._folded += 1
+        line = (
+            f"Turn {self._folded}: "
+            f"Q='{question[:SUMMARY_QUESTION_CHARS]}' → "
+            f"A='{answer[:SUMMARY_ANSWER_CHARS]}'"
+        )
+        self._summary = f"{self._summary}\n{line}" if self._summary else line
+
+        self._messages    = self._messages[end:]
+        self._turn_starts = [start - end for start in self._turn_starts[1:]]
+
+
+def _text_of(content) -> str:
+    """Plain text of a message's content (string or list of blocks)."""
+    if isinstance(content, str):
+        return content
+    parts = []
+    for block in content:
+        text = block.get("text") if isinstance(block, dict) else getattr(block, "text", None)
+        if text:
+            parts.append(text)
+    return " ".join(parts).strip()
+
+
+def _as_dict(block) -> dict:
+    """Content blocks are either plain dicts or SDK models (response.content)."""
+    if isinstance(block, dict):
+        return block
+    return block.model_dump(exclude_none=True)
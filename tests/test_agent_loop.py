@@ -0,0 +1,96 @@
+"""
+tests/test_agent_loop.py
+========================
+AgentLoop against a fake Anthropic client — no network, no API key.
+"""
+
+import re
+from types import SimpleNamespace
+
+import pytest
+
+from agent.agent_loop import AgentLoop, SYSTEM_FOLLOWUP, SYSTEM_RESEARCHER
+from agent.prompts    import FOLLOWUP_PROMPT, RESEARCHER_PROMPT
+
+
+# ── Fakes ─────────────────────────────────────────────────────────────────────
+
+class FakeBlock(SimpleNamespace):
+    def model_dump(self, **kwargs) -> dict:
+        return dict(vars(self))
+
+
+def fake_response(stop_reason: str, *blocks, cache_read: int = 0, cache_write: int = 0) -> SimpleNamespace:
+    usage = SimpleNamespace(
+        input_tokens                = 10,
+        output_tokens               = 5,
+        cache_read_input_tokens     = cache_read,
+        cache_creation_input_tokens = cache_write,
+    )
+    return SimpleNamespace(stop_reason=stop_reason, content=list(blocks), usage=usage)
+
+
+class FakeMessages:
+    """Replays canned responses and records every create() call."""
+
+    def __init__(self, responses: list):
+        self.responses = list(responses)
+        self.calls     = []
+
+    def create(self, **params):
+        self.calls.append(params)
+        return self.responses.pop(0)
+
+
+@pytest.fixture
+def agent():
+    loop = AgentLoop()
+    loop.tool_calls = []
+    loop.registry._dispatch = lambda name, tool_input: loop.tool_calls.append(tool_input) or "Result 1: stub"
+    return loop
+
+
+# ── Prompt caching ────────────────────────────────────────────────────────────
+
+def test_every_step_sends_the_same_system_object(agent):
+    tool_use = FakeBlock(type="tool_use", id="t1", name="web_search", input={"query": "fusion"})
+    answer   = FakeBlock(type="text", text="Fusion is hard.")
+    messages = FakeMessages([fake_response("tool_use", tool_use), fake_response("end_turn", answer)])
+    agent.client = SimpleNamespace(messages=messages)
+
+    assert agent.run("What is new in fusion?") == "Fusion is hard."
+
+    first, second = messages.calls
+    assert first["system"] is second["system"] is SYSTEM_RESEARCHER
+
+
+@pytest.mark.parametrize("system", [SYSTEM_RESEARCHER, SYSTEM_FOLLOWUP])
+def test_system_prompts_are_immutable(system):
+    assert isinstance(system, tuple)
+    with pytest.raises(TypeError):
+        system[0]["text"] = "changed"
+    with pytest.raises(TypeError):
+        system[0]["cache_control"]["type"] = "persistent"
+
+
+@pytest.mark.parametrize("prompt", [RESEARCHER_PROMPT, FOLLOWUP_PROMPT])
+def test_system_prompts_have_no_dynamic_content(prompt):
+    assert "{" not in prompt and "}" not in prompt          # No unfilled templates
+    assert not re.search(r"\b(19|20)\d\d\b", prompt)         # No years / dates
+    assert not re.search(r"\d{1,2}:\d{2}", prompt)           # No times of day
+
+
+# ── Token budget ──────────────────────────────────────────────────────────────
+
+def test_budget_counts_cached_tokens_and_stops_before_running_tools(agent):
+    tool_use = FakeBlock(type="tool_use", id="t1", name="web_search", input={"query": "fusion"})
+    messages = FakeMessages([fake_response("tool_use", tool_use, cache_read=60, cache_write=40)])
+    agent.client       = SimpleNamespace(messages=messages)
+    agent.token_budget = 100   # 10 in + 5 out alone would fit; 115 with the cache doesn't
+
+    answer = agent.run("What is new in fusion?")
+
+    assert "token budget of 100 hit" in answer
+    assert agent._question_tokens == 115
+    assert agent.tool_calls == []
+    assert len(messages.calls) == 1
@@ -0,0 +1,56 @@
+"""
+tests/test_compression.py
+=========================
+compress_old_tool_results() only touches earlier questions.
+"""
+
+from memory.compression  import compress_old_tool_results
+from memory.conversation import ConversationMemory
+
+SEARCH_OUTPUT = "Result 1:\n  Title: A\n\nResult 2:\n  Title: B\n"
+
+
+def _tool_step(memory: ConversationMemory, call_id: str, query: str):
+    memory.add_assistant_message([
+        {"type": "tool_use", "id": call_id, "name": "web_search", "input": {"query": query}},
+    ])
+    memory.add_tool_results([
+        {"type": "tool_result", "tool_use_id": call_id, "content": SEARCH_OUTPUT},
+    ])
+
+
+def _tool_outputs(messages: list[dict]) -> list[str]:
+    return [
+        block["content"]
+        for message in messages if isinstance(message["content"], list)
+        for block in message["content"] if block.get("type") == "tool_result"
+    ]
+
+
+def test_current_question_results_stay_verbatim():
+    memory = ConversationMemory()
+    memory.add_user_message("Q1")
+    for n in range(3):
+        _tool_step(memory, f"t{n}", f"query {n}")
+
+    messages = compress_old_tool_results(memory.get_messages(), memory.current_turn_start())
+
+    assert _tool_outputs(messages) == [SEARCH_OUTPUT] * 3
+
+
+def test_earlier_question_results_are_summarised():
+    memory = ConversationMemory()
+    memory.add_user_message("Q1")
+    _tool_step(memory, "t1", "fusion")
+    memory.add_assistant_message([{"type": "text", "text": "A1"}])
+    memory.add_user_message("Q2")
+    _tool_step(memory, "t2", "fission")
+
+    original = memory.get_messages()
+    messages = compress_old_tool_results(original, memory.current_turn_start())
+
+    assert _tool_outputs(messages) == [
+        f'[web_search] OK ({len(SEARCH_OUTPUT)} chars) | query="fusion" | 2 results',
+        SEARCH_OUTPUT,
+    ]
+    assert _tool_outputs(original) == [SEARCH_OUTPUT] * 2   # Input left untouched
@@ -0,0 +1,77 @@
+"""
+tests/test_conversation.py
+==========================
+ConversationMemory sliding window.
+"""
+
+import copy
+
+import pytest
+
+from memory.conversation import ConversationMemory
+
+
+@pytest.mark.parametrize("max_turns", [0, -1])
+def test_max_turns_below_one_is_rejected(max_turns):
+    with pytest.raises(ValueError):
+        ConversationMemory(max_turns=max_turns)
+
+
+def test_single_turn_window_folds_previous_question():
+    memory = ConversationMemory(max_turns=1)
+    memory.add_user_message("First?")
+    memory.add_assistant_message([{"type": "text", "text": "One."}])
+    memory.add_user_message("Second?")
+
+    assert memory.get_messages() == [{"role": "user", "content": "Second?"}]
+    assert "First?" in memory.get_summary()
+
+
+# ── Cache breakpoint (get_messages_for_api) ───────────────────────────────────
+
+class SdkBlock:
+    """Stands in for an SDK content block (a pydantic model)."""
+
+    def __init__(self, **fields):
+        self.fields = fields
+
+    def model_dump(self, exclude_none: bool = False) -> dict:
+        return {k: v for k, v in self.fields.items() if not (exclude_none and v is None)}
+
+
+def test_string_question_becomes_cached_text_block():
+    memory = ConversationMemory()
+    memory.add_user_message("What is fusion?")
+
+    assert memory.get_messages_for_api() == [{
+        "role":    "user",
+        "content": [{"type": "text", "text": "What is fusion?", "cache_control": {"type": "ephemeral"}}],
+    }]
+
+
+def test_sdk_blocks_go_through_model_dump():
+    memory = ConversationMemory()
+    memory.add_user_message("Q")
+    memory.add_assistant_message([SdkBlock(type="text", text="A", citations=None)])
+
+    last = memory.get_messages_for_api()[-1]
+
+    assert last["content"] == [{"type": "text", "text": "A", "cache_control": {"type": "ephemeral"}}]
+
+
+def test_only_last_message_is_marked_and_history_is_untouched():
+    memory = ConversationMemory()
+    memory.add_user_message("Q")
+    memory.add_assistant_message([{"type": "tool_use", "id": "t1", "name": "web_search", "input": {}}])
+    memory.add_tool_results([{"type": "tool_result", "tool_use_id": "t1", "content": "R"}])
+    before = copy.deepcopy(memory.get_messages())
+
+    messages = memory.get_messages_for_api()
+
+    marked = [
+        i for i, message in enumerate(messages)
+        if isinstance(message["content"], list)
+        and any("cache_control" in block for block in message["content"])
+    ]
+    assert marked == [len(messages) - 1]
+    assert memory.get_messages() == before
@@ -0,0 +1,49 @@
+"""
+tests/test_session.py
+=====================
+Retry behaviour of the shared HTTP sessions, against a local server.
+"""
+
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+import pytest
+
+from tools.session import RETRY_TOTAL, make_session
+
+
+class RetryAfterHandler(BaseHTTPRequestHandler):
+    """Always 503, asking the client to come back in an hour."""
+
+    hits = 0
+
+    def do_GET(self):
+        type(self).hits += 1
+        self.send_response(503)
+        self.send_header("Retry-After", "3600")
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server_url():
+    server = HTTPServer(("127.0.0.1", 0), RetryAfterHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}/"
+    server.shutdown()
+
+
+def test_retry_after_header_is_ignored(server_url):
+    RetryAfterHandler.hits = 0
+
+    start    = time.perf_counter()
+    response = make_session().get(server_url, timeout=5)
+
+    assert response.status_code == 503
+    assert RetryAfterHandler.hits == RETRY_TOTAL + 1
+    assert time.perf_counter() - start < 3
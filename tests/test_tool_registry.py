@@ -0,0 +1,92 @@
+"""
+tests/test_tool_registry.py
+===========================
+ToolRegistry memo: reuse, persistence, expiry.
+"""
+
+import time
+
+import pytest
+
+from agent import tool_registry
+from agent.tool_registry import ToolRegistry
+
+
+@pytest.fixture
+def registry():
+    registry = ToolRegistry()
+    registry.calls = []
+    registry._dispatch = lambda name, tool_input: registry.calls.append(tool_input) or "Result 1: x"
+    return registry
+
+
+def test_repeat_call_is_served_from_memo(registry):
+    registry.execute("web_search", {"query": "Fusion "})
+    registry.execute("web_search", {"query": "fusion", "num_results": 5})
+
+    assert len(registry.calls) == 1
+
+
+# The memo is the only cache for Serper responses and scraped pages — the
+# tools themselves always hit the network.
+
+def test_repeat_scrape_is_not_fetched_again(registry):
+    registry.scraper.scrape = lambda url: registry.calls.append(url) or f"SOURCE: {url}"
+    del registry._dispatch   # Real routing, fake scraper
+
+    registry.execute("web_scraper", {"url": "https://x.test/a"})
+    registry.execute("web_scraper", {"url": "https://x.test/a"})
+
+    assert registry.calls == ["https://x.test/a"]
+
+
+def test_error_outputs_are_not_memoized(registry):
+    registry._dispatch = lambda name, tool_input: registry.calls.append(tool_input) or "Error: timed out"
+
+    registry.execute("web_scraper", {"url": "https://x.test/a"})
+    registry.execute("web_scraper", {"url": "https://x.test/a"})
+
+    assert len(registry.calls) == 2
+
+
+def test_memo_round_trips_through_json(registry):
+    registry.execute("web_search", {"query": "fusion"})
+    tool_registry._MEMO.save()
+
+    fresh = tool_registry._ToolMemo()
+    fresh.load()
+
+    assert fresh.get(ToolRegistry._memo_key("web_search", {"query": "fusion"})) == "Result 1: x"
+
+
+def test_expired_rows_are_not_loaded(registry, monkeypatch):
+    registry.execute("web_search", {"query": "fusion"})
+    tool_registry._MEMO.save()
+
+    later = time.time() + tool_registry.MEMO_TTL_SECS + 1
+    monkeypatch.setattr(time, "time", lambda: later)
+    fresh = tool_registry._ToolMemo()
+    fresh.load()
+
+    assert fresh.get(ToolRegistry._memo_key("web_search", {"query": "fusion"})) is None
+
+
+def test_saves_are_throttled(registry):
+    registry.execute("web_search", {"query": "fusion"})
+
+    assert not tool_registry.MEMO_PATH.exists()
+
+
+def test_save_does_not_hold_the_lock_during_file_io(registry, monkeypatch):
+    registry.execute("web_search", {"query": "fusion"})
+    memo   = tool_registry._MEMO
+    writes = []
+
+    def write_bytes(path, data):
+        writes.append(memo._lock.locked())   # Locked → put() from another thread would block
+        return len(data)
+
+    monkeypatch.setattr(type(tool_registry.MEMO_PATH), "write_bytes", write_bytes)
+    memo.save()
+
+    assert writes == [False]
@@ -0,0 +1,67 @@
+"""
+tests/test_web_scraper.py
+=========================
+Page decoding and text extraction (no network).
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from tools.web_scraper import CHUNK_BYTES, MAX_BYTES, WebScraper
+
+
+def _page(body: str) -> str:
+    return f"<html><head><title>T</title></head><body><p>{body}</p></body></html>"
+
+
+def test_http_charset_is_used_for_non_utf8_pages():
+    html = _page("café naïve").encode("cp1252")
+
+    assert "café naïve" in WebScraper()._extract("https://x.test", html, encoding="windows-1252")
+
+
+def test_character_cut_at_max_bytes_is_dropped():
+    html = _page("naïve").encode("utf-8")
+    cut  = html[: html.index("ï".encode("utf-8")) + 1]   # Half of "ï"
+
+    assert WebScraper._decode(cut, None, truncated=True).endswith("na")
+
+
+def test_bad_byte_at_end_of_complete_page_is_not_trimmed():
+    html = "<p>Ça va, café".encode("cp1252")   # Last byte is invalid UTF-8
+
+    assert WebScraper._decode(html, None, truncated=False).endswith("café")
+
+
+def test_long_whitespace_run_is_cleaned_in_linear_time():
+    text = "Intro" + " " * 40_000 + "\xa0" * 40_000 + "\n\n  Body  "
+
+    start   = time.perf_counter()
+    cleaned = WebScraper()._clean_text(text)
+
+    assert cleaned == "Intro\nBody"
+    assert time.perf_counter() - start < 0.5
+
+
+@pytest.mark.parametrize("url", ["http://[::1", "http://exa\nmple.com/"])
+def test_malformed_url_is_an_error_string_on_both_paths(url):
+    scraper = WebScraper()
+
+    assert scraper.scrape(url).startswith("Error fetching")
+    assert asyncio.run(scraper.ascrape(url)).startswith("Error fetching")
+
+
+def test_sync_and_async_reads_share_the_cap():
+    chunks = [b"a" * CHUNK_BYTES] * (MAX_BYTES // CHUNK_BYTES + 2)
+
+    async def achunks():
+        for chunk in chunks:
+            yield chunk
+
+    capped = WebScraper._read_capped(chunks)
+
+    assert capped == (b"a" * MAX_BYTES, True)
+    assert asyncio.run(WebScraper._aread_capped(achunks())) == capped
+    assert WebScraper._read_capped([b"short"]) == (b"short", False)
@@ -0,0 +1,77 @@
+"""
+tools/cache.py
+==============
+Tiny thread-safe LRU cache with time-based expiry, shared by the tools.
+
+WHY not functools.lru_cache?
+  - Entries need to expire (search results go stale)
+  - The same cache must serve both the sync and async code paths
+  - Callers decide what is worth caching (e.g. never cache errors)
+
+Usage:
+    cache = TTLCache(maxsize=128, ttl=600)
+    hit   = cache.get(key)          # → None on miss or expiry
+    cache.set(key, value)
+
+Timestamps are wall-clock (time.time()), so entries can be saved and
+reloaded by another process with their age intact (see items()).
+"""
+
+import threading
+import time
+from collections import OrderedDict
+
+
+class TTLCache:
+    """LRU cache whose entries expire `ttl` seconds after being stored."""
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl     = ttl
+        self._data: OrderedDict = OrderedDict()   # key → (timestamp, value)
+        self._lock = threading.Lock()             # Tools may run on several threads
+
+    def get(self, key):
+        """Returns the cached value, or None if missing or expired."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+
+            stored_at, value = entry
+            if time.time() - stored_at >= self.ttl:
+                del self._data[key]
+                return None
+
+            self._data.move_to_end(key)   # Mark as most recently used
+            return value
+
+    def set(self, key, value, stored_at: float | None = None):
+        """
+        Stores a value, evicting the least recently used entry if full.
+
+        Args:
+            stored_at: Original time.time() of the value when reloading a
+                       saved entry; defaults to now.
+        """
+        with self._lock:
+            self._data[key] = (time.time() if stored_at is None else stored_at, value)
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def items(self) -> list[tuple]:
+        """(key, stored_at, value) for every live entry, oldest first. Drops expired ones."""
+        with self._lock:
+            now     = time.time()
+            expired = [key for key, (stored_at, _) in self._data.items() if now - stored_at >= self.ttl]
+            for key in expired:
+                del self._data[key]
+            return [(key, stored_at, value) for key, (stored_at, value) in self._data.items()]
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
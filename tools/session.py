@@ -0,0 +1,81 @@
+"""
+tools/session.py
+================
+Shared HTTP session factory for the tools.
+
+WHY:
+  Module-level requests.get/post open a fresh TCP + TLS connection on every
+  call (~80-200 ms of handshake). A requests.Session keeps connections alive
+  and reuses them, so back-to-back searches/scrapes to the same host only
+  pay the handshake once.
+
+get_shared_session() goes one step further: one session per name for the
+whole process, so a new AgentLoop / ToolRegistry reuses warm connections.
+Sessions are shared across threads — keep per-request data (API keys,
+etc.) in the request, not on the session.
+
+Transient failures (429, 502, 503, 504) are retried with a short backoff.
+Retry-After headers are ignored: the scraper talks to arbitrary hosts,
+and a server must not decide how long a tool thread sleeps (a header of
+3600 would block it for an hour, far past the request timeout).
+After the last retry the response is returned as-is, so callers still see
+the status via raise_for_status().
+"""
+
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+POOL_CONNECTIONS = 4     # Distinct hosts kept in the pool
+POOL_MAXSIZE     = 16    # Connections kept per host
+RETRY_TOTAL      = 2
+RETRY_BACKOFF    = 0.2   # Seconds: 0.2, 0.4, ...
+RETRY_STATUSES   = [429, 502, 503, 504]
+
+_SHARED: dict[str, requests.Session] = {}
+_SHARED_LOCK = threading.Lock()
+
+
+def make_session(headers: dict | None = None) -> requests.Session:
+    """
+    Returns a keep-alive Session with pooling and retries mounted.
+
+    Args:
+        headers: Default headers sent with every request on this session.
+    """
+    session = requests.Session()
+    if headers:
+        session.headers.update(headers)
+
+    retry = Retry(
+        total                      = RETRY_TOTAL,
+        backoff_factor             = RETRY_BACKOFF,
+        status_forcelist           = RETRY_STATUSES,
+        allowed_methods            = None,    # Also retry POST — our searches are idempotent
+        raise_on_status            = False,   # Hand the final response back to the caller
+        respect_retry_after_header = False,   # Our backoff, not the server's (see above)
+    )
+    adapter = HTTPAdapter(
+        pool_connections = POOL_CONNECTIONS,
+        pool_maxsize     = POOL_MAXSIZE,
+        max_retries      = retry,
+    )
+    session.mount("https://", adapter)
+    session.mount("http://",  adapter)
+    return session
+
+
+def get_shared_session(name: str, headers: dict | None = None) -> requests.Session:
+    """
+    Returns the process-wide session called `name`, creating it on first use.
+
+    Args:
+        name:    e.g. "serper" or "scraper".
+        headers: Default headers, only used when the session is created.
+    """
+    with _SHARED_LOCK:
+        if name not in _SHARED:
+            _SHARED[name] = make_session(headers)
+        return _SHARED[name]
@@ -9,18 +9,31 @@ WHY this exists alongside web_search:
   - Pattern: search → find best URL → scrape → get full content
 
 WHAT it does step by step:
-  1. Makes an HTTP GET request to the URL
-  2. Parses HTML with BeautifulSoup
+  1. Makes an HTTP GET request to the URL (pooled keep-alive session),
+     streaming at most MAX_BYTES of the body
+  2. Parses HTML with selectolax (BeautifulSoup + lxml as fallback)
   3. Strips noise (scripts, nav, ads, footer)
   4. Extracts clean readable text
   5. Truncates to 3000 chars so Claude's context isn't overwhelmed
 
-Install: pip install requests beautifulsoup4
+Repeat scrapes of a URL are answered from ToolRegistry's memo (one
+cache for every tool), so this module always fetches.
+
+scrape() is the sync entry point; ascrape() is the async one used by
+AsyncAgentLoop. Both share the parsing code.
+
+Install: pip install requests selectolax beautifulsoup4 lxml
 """
 
+import asyncio
+import codecs
 import re
+import httpx
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer, UnicodeDammit
+from selectolax.lexbor import LexborHTMLParser
+
+from tools.session import get_shared_session
 
 
 # Tags that never contain useful article content
@@ -37,6 +50,20 @@ NOISE_TAGS = [
     "advertisement",# Ads
 ]
 
+# bs4 fallback only: just these subtrees are built when parsing — <head>
+# scripts, styles and meta tags are skipped instead of built then removed.
+# (Noise *inside* <body> still has to be stripped, see step 5.)
+PARSE_ONLY = SoupStrainer(["title", "body"])
+
+# Inline styles that hide an element (often nav/ad clutter)
+_HIDDEN_STYLE_RE = re.compile(r"display:\s*none|visibility:\s*hidden")
+
+# Class names that usually wrap the article body
+_MAIN_CLASS_RE = re.compile(r"article|content|post|story", re.I)
+
+# _clean_text(): runs of 2+ spaces
+_MULTISPACE_RE = re.compile(r" {2,}")
+
 # Realistic browser header so sites don't block us
 REQUEST_HEADERS = {
     "User-Agent": (
@@ -53,6 +80,34 @@ REQUEST_HEADERS = {
 MAX_CHARS    = 3000   # Max characters returned to Claude
 TIMEOUT_SECS = 10     # How long to wait for a page to load
 
+# Stop downloading after this many (decompressed) body bytes. ~10x headroom
+# over MAX_CHARS of text for markup; the article body is almost always near
+# the top, and the parsers cope fine with a truncated document.
+MAX_BYTES    = 256 * 1024
+CHUNK_BYTES  = 64 * 1024
+
+
+class _CappedBody:
+    """
+    Collects body chunks up to MAX_BYTES — the one place the cap and the
+    "truncated" rule live, shared by the sync and async reads.
+    """
+
+    def __init__(self):
+        self.chunks    = []
+        self.total     = 0
+        self.truncated = False
+
+    def add(self, chunk: bytes) -> bool:
+        """Keep a chunk. Returns False once MAX_BYTES is reached (stop reading)."""
+        self.chunks.append(chunk)
+        self.total    += len(chunk)
+        self.truncated = self.total >= MAX_BYTES
+        return not self.truncated
+
+    def result(self) -> tuple[bytes, bool]:
+        return b"".join(self.chunks), self.truncated
+
 
 class WebScraper:
     """
@@ -66,6 +121,14 @@ class WebScraper:
         text    = scraper.scrape("https://example.com/article")
     """
 
+    def __init__(self):
+        # Keep-alive connections, shared process-wide and reused when
+        # scraping the same host again
+        self._session = get_shared_session("scraper", REQUEST_HEADERS)
+
+        # Created on first async call so it binds to the running event loop
+        self._async_client: httpx.AsyncClient | None = None
+
     def scrape(self, url: str) -> str:
         """
         Main method. Fetches and cleans a web page.
@@ -84,14 +147,23 @@ class WebScraper:
         if not url.startswith(("http://", "https://")):
             return f"Error: Invalid URL '{url}'. Must start with http:// or https://"
 
-        # ── Step 2: Fetch the page ────────────────────────────────────────────
+        # ── Step 2: Fetch the page (headers first, body streamed) ─────────────
         try:
-            response = requests.get(
-                url,
-                headers = REQUEST_HEADERS,
-                timeout = TIMEOUT_SECS,
-            )
-            response.raise_for_status()  # Raises exception for 4xx/5xx errors
+            with self._session.get(url, stream=True, timeout=TIMEOUT_SECS) as response:
+                response.raise_for_status()  # Raises exception for 4xx/5xx errors
+
+                # ── Step 3: Check content type ────────────────────────────────
+                # Only process HTML pages — skip PDFs, images, etc. before
+                # downloading their body
+                content_type = response.headers.get("Content-Type", "")
+                if "text/html" not in content_type:
+                    return self._content_type_error(content_type)
+
+                html, truncated = self._read_capped(response.iter_content(CHUNK_BYTES))
+
+                # Only trust a charset the server actually sent — requests
+                # assumes ISO-8859-1 for any text/* without one
+                encoding = response.encoding if "charset=" in content_type.lower() else None
 
         except requests.exceptions.Timeout:
             return f"Error: Page took too long to load (>{TIMEOUT_SECS}s). Try a different URL."
@@ -100,52 +172,122 @@ class WebScraper:
             return f"Error: Could not connect to '{url}'. Check the URL or your internet connection."
 
         except requests.exceptions.HTTPError as e:
-            status = e.response.status_code
-            if status == 403:
-                return f"Error: Access denied (403). '{url}' blocks automated requests."
-            elif status == 404:
-                return f"Error: Page not found (404). '{url}' does not exist."
-            else:
-                return f"Error: HTTP {status} from '{url}'."
+            return self._http_error(url, e.response.status_code)
 
         except requests.exceptions.RequestException as e:
             return f"Error fetching '{url}': {str(e)}"
 
-        # ── Step 3: Check content type ────────────────────────────────────────
-        # Only process HTML pages — skip PDFs, images, etc.
-        content_type = response.headers.get("Content-Type", "")
-        if "text/html" not in content_type:
-            return (
-                f"Error: Cannot scrape this file type (Content-Type: {content_type}). "
-                f"web_scraper only works on HTML pages."
+        return self._extract(url, html, encoding, truncated)
+
+    async def ascrape(self, url: str) -> str:
+        """
+        Async version of scrape().
+
+        The fetch is non-blocking; HTML parsing is CPU-bound so it runs in
+        a worker thread to keep the event loop free.
+        """
+        print(f"  📄 Scraping: {url}")
+
+        if not url.startswith(("http://", "https://")):
+            return f"Error: Invalid URL '{url}'. Must start with http:// or https://"
+
+        if self._async_client is None:
+            self._async_client = httpx.AsyncClient(
+                headers          = REQUEST_HEADERS,
+                timeout          = TIMEOUT_SECS,
+                follow_redirects = True,   # requests follows redirects by default
             )
 
-        # ── Step 4: Parse HTML ────────────────────────────────────────────────
-        soup = BeautifulSoup(response.text, "html.parser")
+        try:
+            async with self._async_client.stream("GET", url) as response:
+                response.raise_for_status()
 
-        # ── Step 5: Remove noise ──────────────────────────────────────────────
-        for tag in soup(NOISE_TAGS):
-            tag.decompose()   # Remove tag + all its children from the tree
+                content_type = response.headers.get("Content-Type", "")
+                if "text/html" not in content_type:
+                    return self._content_type_error(content_type)
 
-        # Also remove elements that are visually hidden (often nav/ad clutter)
-        for tag in soup.find_all(style=re.compile(r"display:\s*none|visibility:\s*hidden")):
-            tag.decompose()
+                html, truncated = await self._aread_capped(response.aiter_bytes(CHUNK_BYTES))
+                encoding = response.charset_encoding   # None unless the server sent one
 
-        # ── Step 6: Try to find the main content block ────────────────────────
-        # Many sites wrap article text in semantic tags — use them if available
-        main_content = (
-            soup.find("article")    or   # <article> tag (most news sites)
-            soup.find("main")       or   # <main> tag
-            soup.find(id="content") or   # Common id
-            soup.find(class_=re.compile(r"article|content|post|story", re.I)) or
-            soup.find("body")            # Fallback to full body
+        except httpx.TimeoutException:
+            return f"Error: Page took too long to load (>{TIMEOUT_SECS}s). Try a different URL."
+
+        except httpx.ConnectError:
+            return f"Error: Could not connect to '{url}'. Check the URL or your internet connection."
+
+        except httpx.HTTPStatusError as e:
+            return self._http_error(url, e.response.status_code)
+
+        except (httpx.HTTPError, httpx.InvalidURL) as e:
+            # InvalidURL (bad port, control chars) is not an HTTPError
+            return f"Error fetching '{url}': {str(e)}"
+
+        return await asyncio.to_thread(self._extract, url, html, encoding, truncated)
+
+    async def aclose(self):
+        """Close the async HTTP client (if one was opened)."""
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
+
+    # ── Private helpers ───────────────────────────────────────────────────────
+
+    @staticmethod
+    def _read_capped(chunks) -> tuple[bytes, bool]:
+        """
+        Join body chunks, stopping once MAX_BYTES have been read.
+
+        Returns:
+            (body, truncated) — truncated is True if the read hit MAX_BYTES.
+        """
+        body = _CappedBody()
+        for chunk in chunks:
+            if not body.add(chunk):
+                break   # Closing the response drops the rest of the body
+        return body.result()
+
+    @staticmethod
+    async def _aread_capped(chunks) -> tuple[bytes, bool]:
+        """Async version of _read_capped() for httpx's aiter_bytes()."""
+        body = _CappedBody()
+        async for chunk in chunks:
+            if not body.add(chunk):
+                break
+        return body.result()
+
+    @staticmethod
+    def _content_type_error(content_type: str) -> str:
+        return (
+            f"Error: Cannot scrape this file type (Content-Type: {content_type}). "
+            f"web_scraper only works on HTML pages."
         )
 
-        if not main_content:
-            return "Error: Could not find readable content on this page."
+    def _extract(
+        self,
+        url:       str,
+        html:      bytes,
+        encoding:  str | None = None,
+        truncated: bool       = False,
+    ) -> str:
+        """
+        Turn a fetched HTML page into clean, truncated text (steps 4-10).
 
-        # ── Step 7: Extract text ──────────────────────────────────────────────
-        text = main_content.get_text(separator="\n")
+        Args:
+            html:      Raw body bytes.
+            encoding:  Charset from the Content-Type header, if any.
+            truncated: True if the body was cut off at MAX_BYTES.
+        """
+        markup = self._decode(html, encoding, truncated)
+
+        # ── Steps 4-7: Parse, strip noise, find main content, get text ────────
+        try:
+            title_text, text = self._parse_selectolax(markup)
+        except Exception:
+            # selectolax rejected the page — retry with the forgiving bs4 path
+            title_text, text = self._parse_bs4(markup)
+
+        if text is None:
+            return "Error: Could not find readable content on this page."
 
         # ── Step 8: Clean whitespace ──────────────────────────────────────────
         text = self._clean_text(text)
@@ -155,9 +297,6 @@ class WebScraper:
 
         # ── Step 9: Add metadata header ───────────────────────────────────────
         # Give Claude context about where this text came from
-        title = soup.find("title")
-        title_text = title.get_text().strip() if title else "Unknown"
-
         header = (
             f"SOURCE: {url}\n"
             f"TITLE:  {title_text}\n"
@@ -170,35 +309,133 @@ class WebScraper:
 
         return header + text
 
-    # ── Private helpers ───────────────────────────────────────────────────────
+    @staticmethod
+    def _decode(html: bytes, encoding: str | None, truncated: bool) -> str:
+        """
+        Decode the body to text (Lexbor would read raw bytes as UTF-8).
 
-    def _clean_text(self, text: str) -> str:
+        UTF-8 (declared or not) is tried first. Anything else goes to
+        UnicodeDammit, with the HTTP charset as the definite encoding —
+        otherwise it guesses from the bytes, e.g. cp1252 "naïve" → "naďve".
         """
-        Removes excessive whitespace from extracted text.
+        try:
+            if encoding:
+                encoding = codecs.lookup(encoding).name
+        except LookupError:
+            encoding = None   # Bogus charset header — let UnicodeDammit detect
+
+        if encoding in (None, "utf-8"):
+            try:
+                return html.decode("utf-8")
+            except UnicodeDecodeError as e:
+                if truncated and e.start >= len(html) - 3:
+                    # Valid UTF-8 whose last character was cut off at MAX_BYTES
+                    return html[:e.start].decode("utf-8")
+
+        return UnicodeDammit(
+            html,
+            known_definite_encodings = [encoding] if encoding else [],
+            is_html                  = True,
+        ).unicode_markup
+
+    def _parse_selectolax(self, markup: str) -> tuple[str, str | None]:
+        """
+        Fast path: selectolax + Lexbor (C parser, no Python object per node).
 
-        Raw get_text() output has tons of blank lines and spaces
-        from HTML structure — this makes it readable.
+        Returns:
+            (title, main content text) — text is None if nothing was found.
+        """
+        # ── Step 4: Parse HTML ────────────────────────────────────────────────
+        tree = LexborHTMLParser(markup)
+
+        title      = tree.css_first("title")
+        title_text = title.text().strip() if title else "Unknown"
+
+        # ── Step 5: Remove noise ──────────────────────────────────────────────
+        tree.strip_tags(NOISE_TAGS)   # Removes tag + all its children
+
+        # Also remove elements that are visually hidden (often nav/ad clutter).
+        # Reverse document order: children go before their parents.
+        hidden = [
+            node for node in tree.css("[style]")
+            if _HIDDEN_STYLE_RE.search(node.attributes.get("style") or "")
+        ]
+        for node in reversed(hidden):
+            node.decompose()
+
+        # ── Step 6: Try to find the main content block ────────────────────────
+        main_content = (
+            tree.css_first("article")  or   # <article> tag (most news sites)
+            tree.css_first("main")     or   # <main> tag
+            tree.css_first("#content") or   # Common id
+            next(
+                (node for node in tree.css("[class]")
+                 if _MAIN_CLASS_RE.search(node.attributes.get("class") or "")),
+                None,
+            ) or
+            tree.body                       # Fallback to full body
+        )
+
+        if main_content is None:
+            return title_text, None
+
+        # ── Step 7: Extract text ──────────────────────────────────────────────
+        return title_text, main_content.text(separator="\n")
+
+    def _parse_bs4(self, markup: str) -> tuple[str, str | None]:
         """
-        # Remove lines that are just whitespace
-        lines = [line.strip() for line in text.splitlines()]
-        lines = [line for line in lines if line]
+        Fallback path: BeautifulSoup + lxml. Slower, but very forgiving.
 
-        # Collapse runs of 3+ blank lines into 2
-        cleaned_lines = []
-        blank_count   = 0
+        Returns:
+            (title, main content text) — text is None if nothing was found.
+        """
+        soup = BeautifulSoup(markup, "lxml", parse_only=PARSE_ONLY)
 
-        for line in lines:
-            if line == "":
-                blank_count += 1
-                if blank_count <= 2:
-                    cleaned_lines.append(line)
-            else:
-                blank_count = 0
-                cleaned_lines.append(line)
+        title      = soup.find("title")
+        title_text = title.get_text().strip() if title else "Unknown"
 
-        text = "\n".join(cleaned_lines)
+        for tag in soup(NOISE_TAGS):
+            tag.decompose()
 
-        # Collapse multiple spaces into one
-        text = re.sub(r" {2,}", " ", text)
+        for tag in soup.find_all(style=_HIDDEN_STYLE_RE):
+            tag.decompose()
 
+        main_content = (
+            soup.find("article")    or
+            soup.find("main")       or
+            soup.find(id="content") or
+            soup.find(class_=_MAIN_CLASS_RE) or
+            soup.find("body")
+        )
+
+        if not main_content:
+            return title_text, None
+
+        return title_text, main_content.get_text(separator="\n")
+
+    @staticmethod
+    def _http_error(url: str, status: int) -> str:
+        """Readable message for a 4xx/5xx response."""
+        if status == 403:
+            return f"Error: Access denied (403). '{url}' blocks automated requests."
+        elif status == 404:
+            return f"Error: Page not found (404). '{url}' does not exist."
+        else:
+            return f"Error: HTTP {status} from '{url}'."
+
+    def _clean_text(self, text: str) -> str:
+        """
+        Removes excessive whitespace from extracted text.
+
+        Raw get_text() output has tons of blank lines and spaces
+        from HTML structure — this makes it readable.
+
+        Linear in the page size on purpose: pages come from untrusted
+        sites, and a regex like \s*\n\s* backtracks quadratically over a
+        long whitespace run that has no line break in it.
+          1. Strip every line and drop blank ones
+          2. Runs of spaces → one space
+        """
+        text = "\n".join(line for line in map(str.strip, text.splitlines()) if line)
+        text = _MULTISPACE_RE.sub(" ", text)
         return text.strip()
@@ -10,26 +10,57 @@ WHY Serper instead of Claude's built-in search?
   - Claude's built-in search is a black box; this is transparent
 
 Get your free key at: https://serper.dev
+
+Repeated queries are answered from ToolRegistry's memo (one cache for
+every tool), so this module always hits the network.
 """
 
 import os
-import requests
+from itertools import chain, islice
+
+import httpx
+import orjson
 from dotenv import load_dotenv
 
+from tools.session import get_shared_session
+
 load_dotenv()
 
+SERPER_URL   = "https://google.serper.dev/search"
+TIMEOUT_SECS = 10    # How long to wait for Serper to answer
+
+# One organic result as Claude sees it
+_RESULT_TMPL = (
+    "Result {i}:\n"
+    "  Title:   {title}\n"
+    "  Summary: {snippet}\n"
+    "  URL:     {link}\n"
+)
+
 
 class WebSearch:
 
     def __init__(self):
         self.api_key     = os.getenv("SERPER_API_KEY")
-        self.base_url    = "https://google.serper.dev/search"
+        self.base_url    = SERPER_URL
         self.num_results = 5
         self.query       = ""
 
         if not self.api_key:
             print("⚠️  WARNING: SERPER_API_KEY not found in .env file!")
 
+        self._headers = {
+            "X-API-KEY":    self.api_key or "",
+            "Content-Type": "application/json",
+        }
+
+        # Keep-alive connection to Serper, shared process-wide. The API key
+        # travels per request so the shared session holds no credentials.
+        self._session = get_shared_session("serper")
+
+        # Created on first async call so it binds to the running event loop
+        self._async_client: httpx.AsyncClient | None = None
+
     # ── Raw API call ──────────────────────────────────────────────────────────
 
     def web_search(self, query: str, num_results: int = 5) -> dict:
@@ -42,19 +73,33 @@ class WebSearch:
         self.query       = query
         self.num_results = num_results
 
-        response = requests.post(
+        response = self._session.post(
+            self.base_url,
+            headers = self._headers,
+            json    = {"q": query, "num": num_results},
+            timeout = TIMEOUT_SECS,
+        )
+        response.raise_for_status()
+
+        return orjson.loads(response.content)   # ~2-3x faster than stdlib json
+
+    async def aweb_search(self, query: str, num_results: int = 5) -> dict:
+        """Async version of web_search()."""
+        self.query       = query
+        self.num_results = num_results
+
+        if self._async_client is None:
+            self._async_client = httpx.AsyncClient(
+                headers = self._headers,
+                timeout = TIMEOUT_SECS,
+            )
+        response = await self._async_client.post(
             self.base_url,
-            headers={
-                "X-API-KEY":    self.api_key,
-                "Content-Type": "application/json",
-            },
-            json={
-                "q":   query,
-                "num": num_results,
-            },
+            json = {"q": query, "num": num_results},
         )
         response.raise_for_status()
-        return response.json()
+
+        return orjson.loads(response.content)
 
     # ── Formatted output (what the agent reads) ───────────────────────────────
 
@@ -68,29 +113,39 @@ class WebSearch:
         Returns:
             Formatted string with direct answer (if any) + top results.
         """
-        data = self.web_search(query, num_results)
-        formatted_results = []
+        return self._format(self.web_search(query, num_results), num_results)
 
+    async def asearch(self, query: str, num_results: int = 5) -> str:
+        """Async version of search_and_format()."""
+        return self._format(await self.aweb_search(query, num_results), num_results)
+
+    async def aclose(self):
+        """Close the async HTTP client (if one was opened)."""
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
+
+    # ── Private helpers ───────────────────────────────────────────────────────
+
+    @staticmethod
+    def _format(data: dict, num_results: int) -> str:
+        """Turn a raw Serper response into the text Claude reads."""
         # ── Direct answer box (e.g. "Who is the CEO of Apple?") ──────────────
-        if "answerBox" in data:
-            answer = data["answerBox"].get("answer", "")
-            if answer:
-                formatted_results.append(f"DIRECT ANSWER: {answer}")
+        answer = data.get("answerBox", {}).get("answer", "")
+        direct = [f"DIRECT ANSWER: {answer}"] if answer else []
 
         # ── Organic search results ────────────────────────────────────────────
-        if "organic" in data:
-            for i, result in enumerate(data["organic"][:num_results]):
-                title   = result.get("title",   "")
-                link    = result.get("link",    "")
-                snippet = result.get("snippet", "")
-
-                if title and link:
-                    formatted_results.append(
-                        f"Result {i+1}:\n"
-                        f"  Title:   {title}\n"
-                        f"  Summary: {snippet}\n"
-                        f"  URL:     {link}\n"
-                    )
-
-        final_output = "\n".join(formatted_results)
+        # Numbered by position, so a skipped result (no title/link) leaves a gap
+        organic = (
+            _RESULT_TMPL.format(
+                i       = i,
+                title   = result["title"],
+                snippet = result.get("snippet", ""),
+                link    = result["link"],
+            )
+            for i, result in enumerate(islice(data.get("organic", ()), num_results), 1)
+            if result.get("title") and result.get("link")
+        )
+
+        final_output = "\n".join(chain(direct, organic))
         return final_output if final_output else "No results found."